@@ -19,6 +19,17 @@ openai.api_key = OPENAI_API_KEY
 GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY')
 genai.configure(api_key=GOOGLE_API_KEY)
 
+# Markdown link/annotation syntax stripped from generated scripts
+MARKDOWN_BRACKETS_RE = re.compile(r"\[.*\]")
+MARKDOWN_PARENTHESES_RE = re.compile(r"\(.*\)")
+
+# JSON-Array of strings embedded in an unformatted search terms response
+SEARCH_TERMS_RE = re.compile(r'\["(?:[^"\\]|\\.)*"(?:,\s*"[^"\\]*")*\]')
+
+# Clients are created on first use and reused for every following request
+g4f_client = None
+gemini_model = None
+
 
 def generate_response(prompt: str, ai_model: str) -> str:
     """
@@ -35,10 +46,13 @@ def generate_response(prompt: str, ai_model: str) -> str:
 
     """
 
+    global g4f_client, gemini_model
+
     if ai_model == 'g4f':
         # Newest G4F Architecture
-        client = Client()
-        response = client.chat.completions.create(
+        if g4f_client is None:
+            g4f_client = Client()
+        response = g4f_client.chat.completions.create(
             model="gpt-3.5-turbo",
             provider=g4f.Provider.You, 
             messages=[{"role": "user", "content": prompt}],
@@ -56,8 +70,9 @@ def generate_response(prompt: str, ai_model: str) -> str:
 
         ).choices[0].message.content
     elif ai_model == 'gemmini':
-        model = genai.GenerativeModel('gemini-pro')
-        response_model = model.generate_content(prompt)
+        if gemini_model is None:
+            gemini_model = genai.GenerativeModel('gemini-pro')
+        response_model = gemini_model.generate_content(prompt)
         response = response_model.text
 
     else:
@@ -135,8 +150,8 @@ def generate_script(video_subject: str, paragraph_number: int, ai_model: str, vo
         response = response.replace("#", "")
 
         # Remove markdown syntax
-        response = re.sub(r"\[.*\]", "", response)
-        response = re.sub(r"\(.*\)", "", response)
+        response = MARKDOWN_BRACKETS_RE.sub("", response)
+        response = MARKDOWN_PARENTHESES_RE.sub("", response)
 
         # Split the script into paragraphs
         paragraphs = response.split("\n\n")
@@ -214,7 +229,7 @@ def get_search_terms(video_subject: str, amount: int, script: str, ai_model: str
         print(colored("[*] GPT returned an unformatted response. Attempting to clean...", "yellow"))
 
         # Attempt to extract list-like string and convert to list
-        match = re.search(r'\["(?:[^"\\]|\\.)*"(?:,\s*"[^"\\]*")*\]', response)
+        match = SEARCH_TERMS_RE.search(response)
         print(match.group())
         if match:
             try:
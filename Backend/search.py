@@ -35,21 +35,24 @@ def search_for_stock_videos(query: str, api_key: str, it: int, min_dur: int) ->
     video_res = 0
     try:
         # loop through each video in the result
+        videos = response["videos"]
         for i in range(it):
             #check if video has desired minimum duration
-            if response["videos"][i]["duration"] < min_dur:
+            if videos[i]["duration"] < min_dur:
                 continue
-            raw_urls = response["videos"][i]["video_files"]
+            raw_urls = videos[i]["video_files"]
             temp_video_url = ""
             
             # loop through each url to determine the best quality
             for video in raw_urls:
                 # Check if video has a valid download link
-                if ".com/video-files" in video["link"]:
+                link = video["link"]
+                if ".com/video-files" in link:
                     # Only save the URL with the largest resolution
-                    if (video["width"]*video["height"]) > video_res:
-                        temp_video_url = video["link"]
-                        video_res = video["width"]*video["height"]
+                    resolution = video["width"]*video["height"]
+                    if resolution > video_res:
+                        temp_video_url = link
+                        video_res = resolution
                         
             # add the url to the return list if it's not empty
             if temp_video_url != "":